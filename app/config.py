@@ -19,3 +19,5 @@ with warnings.catch_warnings(action="ignore", category=UserWarning):
 DEBUG: Final[bool] = config("DEBUG", cast=bool, default=False)
 GITHUB_API_KEY: Final[Secret] = config("GITHUB_API_KEY", cast=Secret)
 GITHUB_API_TIMEOUT: Final[float] = config("GITHUB_API_TIMEOUT", cast=float, default=15)
+HEALTHCHECK_CACHE_TTL: Final[float] = config("HEALTHCHECK_CACHE_TTL", cast=float, default=10)
+VERSION_CACHE_TTL: Final[float] = config("VERSION_CACHE_TTL", cast=float, default=60)
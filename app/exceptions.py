@@ -1,13 +1,15 @@
 """Custom exception classes used throughout this project."""
 
 import abc
+import functools
 from typing import TYPE_CHECKING, override
 
-from starlette.responses import JSONResponse
-from typed_classproperties import classproperty
+import orjson
+from starlette.responses import Response
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from typing import ClassVar
 
     from starlette.requests import Request
 
@@ -25,9 +27,22 @@ __all__: Sequence[str] = (
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _render_error_body(message: str, details: tuple[tuple[str, str | None], ...]) -> bytes:
+    return orjson.dumps({"error_message": message, "details": dict(details)})
+
+
 class _BaseCustomException(Exception, abc.ABC):
     """Base custom exception class that can be converted to an HTTP response."""
 
+    __slots__ = ("message",)
+
+    DEFAULT_MESSAGE: ClassVar[str]
+    """Default message to be used for this exception if no custom message is given."""
+
+    STATUS_CODE: ClassVar[int]
+    """HTTP status code to use when returning this exception as an error response."""
+
     @override
     def __init__(self, message: str | None = None) -> None:
         self.message: str = (
@@ -37,17 +52,7 @@ class _BaseCustomException(Exception, abc.ABC):
 
         super().__init__(self.message)
 
-    @classproperty
-    @abc.abstractmethod
-    def DEFAULT_MESSAGE(cls) -> str:
-        """Default message to be used for this exception if no custom message is given."""
-
-    @classproperty
-    @abc.abstractmethod
-    def STATUS_CODE(cls) -> int:
-        """HTTP status code to use when returning this exception as an error response."""
-
-    def _get_additional_details(self) -> Mapping[str, object]:
+    def _get_additional_details(self) -> Mapping[str, str | None]:
         """Create the content to be used when converting this exception to an HTTP response."""
         return {}
 
@@ -56,20 +61,25 @@ class _BaseCustomException(Exception, abc.ABC):
         return self.message
 
     @classmethod
-    def exception_handler(cls, _request: Request, exc: Exception) -> JSONResponse:
+    def exception_handler(cls, _request: Request, exc: Exception) -> Response:
         """Starlette exception handler to return a correct HTTP response for this exception."""
         if not isinstance(exc, cls):
             raise TypeError
 
-        return JSONResponse(
-            {"error_message": exc.message, "details": cls._get_additional_details(exc)},
+        return Response(
+            _render_error_body(exc.message, tuple(cls._get_additional_details(exc).items())),
             status_code=cls.STATUS_CODE,
+            media_type="application/json",
         )
 
 
 class BaseUnknownPathParameterError(_BaseCustomException, ValueError, abc.ABC):
     """Base custom exception class for when a given URL path parameter is unknown."""
 
+    __slots__ = ("_unknown_value",)
+
+    STATUS_CODE: ClassVar[int] = 404
+
     @override
     def __init__(self, message: str | None = None, unknown_value: str | None = None) -> None:
         self._unknown_value: str | None = (
@@ -87,24 +97,18 @@ class BaseUnknownPathParameterError(_BaseCustomException, ValueError, abc.ABC):
             else self.message
         )
 
-    @classproperty
-    @override
-    def STATUS_CODE(cls) -> int:
-        return 404
-
 
 class UnknownFileTypeError(BaseUnknownPathParameterError):
     """The selected 'file_type' is not a valid value."""
 
+    __slots__ = ()
+
+    DEFAULT_MESSAGE: ClassVar[str] = "Unknown file type."
+
     @override
     def __init__(self, message: str | None = None, file_type: str | None = None) -> None:
         super().__init__(message=message, unknown_value=file_type)
 
-    @classproperty
-    @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Unknown file type."
-
     @property
     def file_type(self) -> str | None:
         """The unknown value that was used as a file type."""
@@ -115,20 +119,21 @@ class UnknownFileTypeError(BaseUnknownPathParameterError):
         self._unknown_value = __value
 
     @override
-    def _get_additional_details(self) -> Mapping[str, object]:
+    def _get_additional_details(self) -> Mapping[str, str | None]:
         return {"file_type": self.file_type}
 
 
 class BaseUnsupportedError(_BaseCustomException, abc.ABC):
     """Base exception class for errors arising from an implementation being unsupported."""
 
-    @classproperty
-    @override
-    def STATUS_CODE(cls) -> int:
-        return 501
+    __slots__ = ()
+
+    STATUS_CODE: ClassVar[int] = 501
 
 
 class _UnsupportedClassError[T](BaseUnsupportedError, abc.ABC):
+    __slots__ = ("_unsupported_class",)
+
     @override
     def __init__(
         self,
@@ -152,6 +157,10 @@ class _UnsupportedClassError[T](BaseUnsupportedError, abc.ABC):
 class UnsupportedVersionFinderError(_UnsupportedClassError["BaseVersionFinder"]):
     """The selected VersionFinder implementation is not supported."""
 
+    __slots__ = ()
+
+    DEFAULT_MESSAGE: ClassVar[str] = "Unsupported version finder."
+
     @override
     def __init__(
         self,
@@ -169,13 +178,8 @@ class UnsupportedVersionFinderError(_UnsupportedClassError["BaseVersionFinder"])
     def version_finder(self, __value: type[BaseVersionFinder], /) -> None:
         self._unsupported_class = __value
 
-    @classproperty
-    @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Unsupported version finder."
-
     @override
-    def _get_additional_details(self) -> Mapping[str, object]:
+    def _get_additional_details(self) -> Mapping[str, str | None]:
         return (
             {
                 "version_finder_name": self.version_finder.__name__,
@@ -189,6 +193,10 @@ class UnsupportedVersionFinderError(_UnsupportedClassError["BaseVersionFinder"])
 class UnsupportedFileFetcherError(_UnsupportedClassError["BaseFileFetcher"]):
     """The selected FileFetcher implementation is not supported."""
 
+    __slots__ = ()
+
+    DEFAULT_MESSAGE: ClassVar[str] = "Unsupported file fetcher."
+
     @override
     def __init__(
         self,
@@ -206,13 +214,8 @@ class UnsupportedFileFetcherError(_UnsupportedClassError["BaseFileFetcher"]):
     def file_fetcher(self, __value: type[BaseFileFetcher], /) -> None:
         self._unsupported_class = __value
 
-    @classproperty
     @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Unsupported file fetcher."
-
-    @override
-    def _get_additional_details(self) -> Mapping[str, object]:
+    def _get_additional_details(self) -> Mapping[str, str | None]:
         return (
             {
                 "file_fetcher_name": self.file_fetcher.__name__,
@@ -226,50 +229,20 @@ class UnsupportedFileFetcherError(_UnsupportedClassError["BaseFileFetcher"]):
 class InvalidVersionFileContentError(_BaseCustomException, ValueError):
     """The retrieved version file's content was not valid."""
 
-    @classproperty
-    @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Invalid version file content."
-
-    @classproperty
-    @override
-    def STATUS_CODE(cls) -> int:
-        return 502
-
-
-class InvalidVersionFileEncodingError(InvalidVersionFileContentError):
-    """The retrieved version file's encoding was not valid."""
-
-    @override
-    def __init__(self, message: str | None = None, encoding: str | None = None) -> None:
-        self.encoding: str | None = encoding.strip() if encoding is not None else encoding
-        del encoding
-
-        super().__init__(message=message)
-
-    @classproperty
-    @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Unknown version file encoding."
+    __slots__ = ()
 
-    @override
-    def __str__(self) -> str:
-        return (
-            f"{self.message.removesuffix('.')}: '{self.encoding}'."
-            if self.encoding
-            else self.message
-        )
+    DEFAULT_MESSAGE: ClassVar[str] = "Invalid version file content."
 
-    @override
-    def _get_additional_details(self) -> Mapping[str, object]:
-        return (
-            {"encoding": self.encoding} if self.encoding else super()._get_additional_details()
-        )
+    STATUS_CODE: ClassVar[int] = 502
 
 
 class MissingPackageInVersionFileError(InvalidVersionFileContentError):
     """The selected package could not be found in the given version file."""
 
+    __slots__ = ("_used_default_message", "package_name")
+
+    DEFAULT_MESSAGE: ClassVar[str] = "Package not found in version file."
+
     @override
     def __init__(self, message: str | None = None, package_name: str | None = None) -> None:
         self.package_name: str | None = (
@@ -282,11 +255,6 @@ class MissingPackageInVersionFileError(InvalidVersionFileContentError):
 
         super().__init__(message=message)
 
-    @classproperty
-    @override
-    def DEFAULT_MESSAGE(cls) -> str:
-        return "Package not found in version file."
-
     @override
     def __str__(self) -> str:
         return (
@@ -298,7 +266,7 @@ class MissingPackageInVersionFileError(InvalidVersionFileContentError):
         )
 
     @override
-    def _get_additional_details(self) -> Mapping[str, object]:
+    def _get_additional_details(self) -> Mapping[str, str | None]:
         return (
             {"package_name": self.package_name}
             if self.package_name
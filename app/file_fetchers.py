@@ -1,20 +1,22 @@
 """File fetchers which can retrieve a selected file from a known location."""
 
 import abc
-import base64
+import asyncio
 from typing import TYPE_CHECKING, override
 
-import aiohttp
 from gidgethub.aiohttp import GitHubAPI
 
 import config
-from exceptions import InvalidVersionFileContentError, InvalidVersionFileEncodingError
+from exceptions import InvalidVersionFileContentError
+from sessions import shared_client_session
 from validators import validate_owner, validate_repo
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import PurePosixPath
-    from typing import Final, TypedDict
+    from typing import Final
+
+    from gidgethub.abc import CACHE_TYPE
 
 
 __all__: Sequence[str] = (
@@ -23,9 +25,25 @@ __all__: Sequence[str] = (
 )
 
 
+_GITHUB_OAUTH_TOKEN: Final[str] = str(config.GITHUB_API_KEY)
+_GITHUB_RESPONSE_CACHE: Final[CACHE_TYPE] = {}
+_IN_FLIGHT_GITHUB_FETCHES: Final[dict[str, asyncio.Task[str]]] = {}
+
+
+def _finish_in_flight_github_fetch(
+    contents_url: str, finished_fetch: asyncio.Task[str]
+) -> None:
+    _IN_FLIGHT_GITHUB_FETCHES.pop(contents_url, None)
+
+    if not finished_fetch.cancelled():
+        finished_fetch.exception()
+
+
 class BaseFileFetcher(abc.ABC):
     """Fetcher callable to fetch a chosen file from a known location."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def __call__(self, content_file: PurePosixPath) -> str:
         """Fetch the selected file using a subclass's fetching implementation."""
@@ -34,11 +52,7 @@ class BaseFileFetcher(abc.ABC):
 class GitHubFileFetcher(BaseFileFetcher):
     """Fetcher callable to download a chosen file from an owner's GitHub repository."""
 
-    if TYPE_CHECKING:
-
-        class _GitHubAPIResponse(TypedDict):
-            encoding: str
-            content: object
+    __slots__ = ("_contents_urls", "_owner", "_repo")
 
     @override
     def __init__(self, *, owner: str, repo: str) -> None:
@@ -48,30 +62,63 @@ class GitHubFileFetcher(BaseFileFetcher):
         validate_repo(repo)
         self._repo: str = repo
 
-    @override
-    async def __call__(self, content_file: PurePosixPath) -> str:
+        self._contents_urls: dict[PurePosixPath, str] = {}
+
+    def _get_contents_url(self, content_file: PurePosixPath) -> str:
+        contents_url: str | None = self._contents_urls.get(content_file, None)
+        if contents_url is not None:
+            return contents_url
+
         if not content_file.is_absolute():
             NON_ABSOLUTE_PATH_MESSAGE: Final[str] = (
                 "Given 'content_file' must be an absolute path."
             )
             raise ValueError(NON_ABSOLUTE_PATH_MESSAGE)
 
-        session: object
-        async with aiohttp.ClientSession(conn_timeout=config.GITHUB_API_TIMEOUT) as session:
-            github_client: GitHubAPI = GitHubAPI(
-                session, f"{self.owner}/{self.repo}", oauth_token=str(config.GITHUB_API_KEY)
-            )
-            response: GitHubFileFetcher._GitHubAPIResponse = await github_client.getitem(
-                f"/repos/{self.owner}/{self.repo}/contents/{str(content_file).removeprefix('/')}"
-            )
+        contents_url = (
+            f"/repos/{self.owner}/{self.repo}/contents/{str(content_file).removeprefix('/')}"
+        )
+        self._contents_urls[content_file] = contents_url
+        return contents_url
+
+    async def _fetch_contents(self, contents_url: str) -> str:
+        github_client: GitHubAPI = GitHubAPI(
+            shared_client_session(),
+            f"{self.owner}/{self.repo}",
+            oauth_token=_GITHUB_OAUTH_TOKEN,
+            cache=_GITHUB_RESPONSE_CACHE,
+        )
+        response: object = await github_client.getitem(
+            contents_url, accept="application/vnd.github.raw"
+        )
+
+        if not isinstance(response, str):
+            raise InvalidVersionFileContentError
 
-        if response["encoding"] != "base64":
-            raise InvalidVersionFileEncodingError(encoding=response["encoding"])
+        return response
 
-        if not isinstance(response["content"], (str, bytes)):
-            raise InvalidVersionFileContentError
+    @override
+    async def __call__(self, content_file: PurePosixPath) -> str:
+        """
+        Fetch the selected file from this fetcher's GitHub repository.
+
+        Concurrent calls for the same file share a single in-flight GitHub request.
+        """
+        contents_url: str = self._get_contents_url(content_file)
+
+        in_flight_fetch: asyncio.Task[str] | None = _IN_FLIGHT_GITHUB_FETCHES.get(
+            contents_url, None
+        )
+        if in_flight_fetch is None:
+            in_flight_fetch = asyncio.create_task(self._fetch_contents(contents_url))
+            _IN_FLIGHT_GITHUB_FETCHES[contents_url] = in_flight_fetch
+            in_flight_fetch.add_done_callback(
+                lambda finished_fetch: _finish_in_flight_github_fetch(
+                    contents_url, finished_fetch
+                )
+            )
 
-        return base64.b64decode(response["content"]).decode()
+        return await asyncio.shield(in_flight_fetch)
 
     @property
     def owner(self) -> str:
@@ -1,13 +1,17 @@
 """Primary HTTP response generation functionality."""
 
-import re
+import asyncio
+import contextlib
+import functools
+import time
 from typing import TYPE_CHECKING, override
 
 import aiohttp
 import gidgethub
+import orjson
 from gidgethub.aiohttp import GitHubAPI
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import RedirectResponse, Response
 from starlette.routing import Route
 from starlette.schemas import SchemaGenerator
 
@@ -18,6 +22,8 @@ from exceptions import (
     BaseUnsupportedError,
     InvalidVersionFileContentError,
 )
+from responses import ORJSONResponse
+from sessions import shared_client_session
 from validators import (
     validate_owner,
     validate_package_name,
@@ -25,208 +31,227 @@ from validators import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
     from typing import Final
 
     from starlette.requests import Request
-    from starlette.responses import Response
 
 
 __all__: Sequence[str] = ("app",)
 
 
+_DASH_DOT_TO_UNDERSCORE_TABLE: Final[Mapping[int, int]] = str.maketrans("-.", "__")
+
+
+def _index_version_files() -> Mapping[tuple[str, str, str], version_finders.VersionMap]:
+    version_file_index: dict[tuple[str, str, str], version_finders.VersionMap] = {}
+
+    version_file: version_finders.VersionMap
+    for version_file in version_finders.VersionMap:
+        owner: str
+        repo: str
+        package_name: str
+        owner, repo, package_name = version_file.name.split("__")
+        version_file_index[(owner, repo, package_name)] = version_file
+
+    return version_file_index
+
+
+_VERSION_FILE_INDEX: Final[Mapping[tuple[str, str, str], version_finders.VersionMap]] = (
+    _index_version_files()
+)
+
+
+@functools.lru_cache(maxsize=256)
 def _version_file_from_url(
-    request_path_params: Mapping[str, object],
+    *, owner: str, repo: str, package_name: str
 ) -> version_finders.VersionMap:
-    owner: str = _parse_value_from_path_params(request_path_params, "owner")
     validate_owner(owner)
-
-    repo: str = _parse_value_from_path_params(request_path_params, "repo")
     validate_repo(repo)
-
-    package_name: str = _parse_value_from_path_params(request_path_params, "package_name")
     validate_package_name(package_name)
 
-    return version_finders.VersionMap[
-        (
-            f"{owner.upper().replace('-', '_').replace('.', '_')}__"
-            f"{repo.upper().replace('-', '_').replace('.', '_')}__"
-            f"{package_name.upper().replace('-', '_').replace('.', '_')}"
-        )
-    ]
+    version_request_key: tuple[str, str, str] = (
+        owner.upper().translate(_DASH_DOT_TO_UNDERSCORE_TABLE),
+        repo.upper().translate(_DASH_DOT_TO_UNDERSCORE_TABLE),
+        package_name.upper().translate(_DASH_DOT_TO_UNDERSCORE_TABLE),
+    )
+    version_file: version_finders.VersionMap | None = _VERSION_FILE_INDEX.get(
+        version_request_key, None
+    )
+    if version_file is None:
+        raise KeyError("__".join(version_request_key))
 
+    return version_file
 
-def _parse_value_from_path_params(
-    request_path_params: Mapping[str, object], param_name: str
-) -> str:
-    value: object | None = request_path_params.get(param_name, None)
-    if value is None or not isinstance(value, str):
-        INVALID_PARAM_MESSAGE: Final[str] = (
-            f"Path must contain a string parameter called '{param_name}'."
-        )
-        raise ValueError(INVALID_PARAM_MESSAGE)
 
-    return value
+def _redirect_package_name(
+    request: Request, package_name: str, new_package_name: str
+) -> RedirectResponse:
+    return RedirectResponse(
+        f"{request.url.path.removesuffix(package_name)}{new_package_name}"
+        f"{f'?{request.url.query}' if request.url.query else ''}",
+        status_code=308,
+    )
 
 
-class _TOMLFindVersionEndpoint:
-    @override
-    def __init__(self, file_type: str) -> None:
-        self.file_type: str = file_type
-
-    async def __call__(self, request: Request) -> Response:
-        """
-        summary: Retrieve the specific version of a package in a project from a known TOML file
-        parameters:
-          - in: path
-            name: owner
-            required: true
-            description: The owner of the repository where the version file is located
-            schema:
+_TOML_FIND_VERSION_ENDPOINT_DOCSTRING: Final[str] = """
+summary: Retrieve the specific version of a package in a project from a known TOML file
+parameters:
+  - in: path
+    name: owner
+    required: true
+    description: The owner of the repository where the version file is located
+    schema:
+      type: string
+    example: CarrotManMatt
+  - in: path
+    name: repo
+    required: true
+    description: The name of the repository where the version file is located
+    schema:
+      type: string
+    example: CCFT-Pymarkdown
+  - in: path
+    name: package_name
+    required: true
+    description: The name of the package to retrieve the version of
+    schema:
+      type: string
+    example: PyMarkdownlnt
+responses:
+  200:
+    description: OK
+    content:
+      application/json:
+        schema:
+          type: object
+          properties:
+            file_type:
               type: string
-            example: CarrotManMatt
-          - in: path
-            name: repo
-            required: true
-            description: The name of the repository where the version file is located
-            schema:
+              enum: [lock, pep621]
+            package_version:
               type: string
-            example: CCFT-Pymarkdown
-          - in: path
-            name: package_name
-            required: true
-            description: The name of the package to retrieve the version of
-            schema:
+              example: 1.2.3
+            package_name:
+              type: string
+              example: django
+  404:
+    description: One or more of the given path parameters were unknown
+    content:
+      application/json:
+        schema:
+          type: object
+          required:
+            - error_message
+            - details
+          properties:
+            error_message:
+              description: The reason for the encountered problem
               type: string
-            example: PyMarkdownlnt
-        responses:
-          200:
-            description: OK
-            content:
-              application/json:
-                schema:
+            details:
+              oneOf:
+                - description: >-
+                    Additional informational details arising from the problem
+                  type: object
+                  properties:
+                    version_request_hash:
+                      description: >-
+                        The unique identifier of the requested package name,
+                        repository owner & repository name
+                        type: string
+                - description:
+                    Additional informational details arising from the problem
                   type: object
                   properties:
                     file_type:
+                      description: The unknown version file type that was requested
                       type: string
-                      enum: [lock, pep621]
-                    package_version:
+                - description:
+                    Additional informational details arising from the problem
+                  type: object
+                  properties:
+                    version_finder_name:
+                      description: >-
+                        The name of the version finder that was expected to be used,
+                        but is internally unsupported
                       type: string
-                      example: 1.2.3
-                    package_name:
+                    version_finder_class:
+                      description: >-
+                        The Python class of the version finder
+                        that was expected to be used, but is internally unsupported
                       type: string
-                      example: django
-          404:
-            description: One or more of the given path parameters were unknown
-            content:
-              application/json:
-                schema:
+                - description:
+                    Additional informational details arising from the problem
                   type: object
-                  required:
-                    - error_message
-                    - details
                   properties:
-                    error_message:
-                      description: The reason for the encountered problem
+                    file_fetcher_name:
+                      description: >-
+                        The name of the file fetcher that was expected to be used,
+                        but is internally unsupported
                       type: string
-                    details:
-                      oneOf:
-                        - description: >-
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            version_request_hash:
-                              description: >-
-                                The unique identifier of the requested package name,
-                                repository owner & repository name
-                                type: string
-                        - description:
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            file_type:
-                              description: The unknown version file type that was requested
-                              type: string
-                        - description:
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            version_finder_name:
-                              description: >-
-                                The name of the version finder that was expected to be used,
-                                but is internally unsupported
-                              type: string
-                            version_finder_class:
-                              description: >-
-                                The Python class of the version finder
-                                that was expected to be used, but is internally unsupported
-                              type: string
-                        - description:
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            file_fetcher_name:
-                              description: >-
-                                The name of the file fetcher that was expected to be used,
-                                but is internally unsupported
-                              type: string
-                            file_fetcher_class:
-                              description: >-
-                                The Python class of the file fetcher
-                                that was expected to be used, but is internally unsupported
-                              type: string
-                        - description:
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            encoding:
-                              description: >-
-                                The unknown encoding type of the file fetcher response,
-                                containing the version file
-                              type: string
-                        - description:
-                            Additional informational details arising from the problem
-                          type: object
-                          properties:
-                            package_name:
-                              description: >-
-                                The name of the requested package
-                                that could not be found in the fetched version file
-                              type: string
-
-          502:
-            description: >-
-              The connection to to the GitHub API is unavailable or incorrectly configured
-            content:
-              application/json:
-                schema:
+                    file_fetcher_class:
+                      description: >-
+                        The Python class of the file fetcher
+                        that was expected to be used, but is internally unsupported
+                      type: string
+                - description:
+                    Additional informational details arising from the problem
                   type: object
-                  required:
-                    - error_message
                   properties:
-                    error_message:
-                      description: The reason for the encountered problem
+                    package_name:
+                      description: >-
+                        The name of the requested package
+                        that could not be found in the fetched version file
                       type: string
-        """  # noqa: D205, D415
-        match _parse_value_from_path_params(request.path_params, "package_name").lower():
+
+  502:
+    description: >-
+      The connection to to the GitHub API is unavailable or incorrectly configured
+    content:
+      application/json:
+        schema:
+          type: object
+          required:
+            - error_message
+          properties:
+            error_message:
+              description: The reason for the encountered problem
+              type: string
+"""
+
+
+def _create_toml_find_version_endpoint(
+    file_type: str,
+) -> Callable[[Request], Awaitable[Response]]:
+    # Only the package version varies between responses for the same version file,
+    # so everything before it is serialised once, leaving the JSON object open
+    response_body_prefixes: Mapping[version_finders.VersionMap, bytes] = {
+        version_file: (
+            orjson.dumps(
+                {"file_type": file_type, "package_name": version_file.value.package_name}
+            ).removesuffix(b"}")
+            + b',"package_version":'
+        )
+        for version_file in version_finders.VersionMap
+    }
+
+    async def toml_find_version_endpoint(request: Request) -> Response:
+        package_name: str = request.path_params["package_name"]
+        match package_name.lower():
             case "pymarkdown":
-                return RedirectResponse(
-                    f"{re.sub(request.url.path, r'(?<=\/)pymarkdown$', 'pymarkdownlnt')}"
-                    f"{f'?{request.url.query}' if request.url.query else ''}",
-                )
+                return _redirect_package_name(request, package_name, "pymarkdownlnt")
             case "pycord":
-                return RedirectResponse(
-                    f"{re.sub(request.url.path, r'(?<=\/)pycord$', 'py-cord')}"
-                    f"{f'?{request.url.query}' if request.url.query else ''}",
-                )
+                return _redirect_package_name(request, package_name, "py-cord")
 
         unknown_version_request_error: KeyError
         try:
             version_file: version_finders.VersionMap = _version_file_from_url(
-                request.path_params
+                owner=request.path_params["owner"],
+                repo=request.path_params["repo"],
+                package_name=package_name,
             )
         except KeyError as unknown_version_request_error:
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "error_message": "Unknown version file request.",
                     "details": {
@@ -236,16 +261,58 @@ class _TOMLFindVersionEndpoint:
                 status_code=404,
             )
 
-        return JSONResponse(
-            {
-                "file_type": self.file_type,
-                "package_version": await version_file.fetch_version(self.file_type),
-                "package_name": version_file.value.package_name,
-            }
+        return Response(
+            b"".join(
+                (
+                    response_body_prefixes[version_file],
+                    orjson.dumps(await version_file.fetch_version(file_type)),
+                    b"}",
+                )
+            ),
+            media_type="application/json",
         )
 
+    toml_find_version_endpoint.__doc__ = _TOML_FIND_VERSION_ENDPOINT_DOCSTRING
+    return toml_find_version_endpoint
 
-async def _healthcheck_endpoint(_request: Request) -> Response:
+
+class _GitHubAPIProbe:
+    """Check the GitHub API is reachable, reusing a recent successful check."""
+
+    __slots__ = ("_last_success", "_lock", "_success_ttl")
+
+    @override
+    def __init__(self, *, success_ttl: float) -> None:
+        self._success_ttl: float = success_ttl
+        self._last_success: float | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _has_recent_success(self) -> bool:
+        return (
+            self._last_success is not None
+            and time.monotonic() - self._last_success < self._success_ttl
+        )
+
+    async def __call__(self, github_client: GitHubAPI) -> None:
+        """Probe the GitHub API, unless it was successfully reached within the TTL."""
+        if self._has_recent_success():
+            return
+
+        async with self._lock:
+            if self._has_recent_success():
+                return
+
+            await github_client.getitem("/octocat")
+            self._last_success = time.monotonic()
+
+
+_github_api_probe: Final[_GitHubAPIProbe] = _GitHubAPIProbe(
+    success_ttl=config.HEALTHCHECK_CACHE_TTL
+)
+_HEALTHCHECK_OK_BODY: Final[bytes] = orjson.dumps({"status": "ok"})
+
+
+async def _healthcheck_endpoint(request: Request) -> Response:
     """
     summary: Retrieve a simple response for whether the application is alive
     responses:
@@ -275,14 +342,64 @@ async def _healthcheck_endpoint(_request: Request) -> Response:
                   description: The reason for the encountered problem
                   type: string
     """  # noqa: D205, D415
-    session: object
-    async with aiohttp.ClientSession(conn_timeout=config.GITHUB_API_TIMEOUT) as session:
-        github_client: GitHubAPI = GitHubAPI(
-            session, requester="", oauth_token=str(config.GITHUB_API_KEY)
+    await _github_api_probe(request.app.state.github_client)
+
+    return Response(_HEALTHCHECK_OK_BODY, media_type="application/json")
+
+
+_MIN_VERSION_CACHE_REFRESH_INTERVAL: Final[float] = 30
+
+
+async def _refresh_cached_versions_periodically() -> None:
+    while True:
+        await version_finders.refresh_cached_versions()
+        await asyncio.sleep(
+            max(config.VERSION_CACHE_TTL / 2, _MIN_VERSION_CACHE_REFRESH_INTERVAL)
         )
-        await github_client.getitem("/octocat")
 
-    return JSONResponse({"status": "ok"})
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: Starlette) -> AsyncIterator[None]:
+    app.state.github_client = GitHubAPI(
+        shared_client_session(), requester="", oauth_token=str(config.GITHUB_API_KEY)
+    )
+
+    version_cache_refresh_task: asyncio.Task[None] | None = (
+        asyncio.create_task(_refresh_cached_versions_periodically())
+        if config.VERSION_CACHE_TTL > 0
+        else None
+    )
+
+    try:
+        yield
+    finally:
+        if version_cache_refresh_task is not None:
+            version_cache_refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await version_cache_refresh_task
+
+        await shared_client_session.close()
+
+
+@functools.lru_cache(maxsize=64)
+def _render_upstream_error_body(error_message: str) -> bytes:
+    return orjson.dumps({"error_message": error_message})
+
+
+def _github_exception_handler(_request: Request, exc: Exception) -> Response:
+    return Response(
+        _render_upstream_error_body(f"Github's response: {exc}"),
+        status_code=502,
+        media_type="application/json",
+    )
+
+
+def _proxy_exception_handler(_request: Request, exc: Exception) -> Response:
+    return Response(
+        _render_upstream_error_body(f"Proxy: {exc}"),
+        status_code=502,
+        media_type="application/json",
+    )
 
 
 schemas: SchemaGenerator = SchemaGenerator(
@@ -303,6 +420,7 @@ schemas: SchemaGenerator = SchemaGenerator(
 
 app: Starlette = Starlette(
     debug=config.DEBUG,
+    lifespan=_lifespan,
     routes=[
         Route(
             "/schema",
@@ -313,27 +431,17 @@ app: Starlette = Starlette(
         *[
             Route(
                 f"/{file_type}/{{owner}}/{{repo}}/{{package_name}}",
-                endpoint=_TOMLFindVersionEndpoint(file_type).__call__,
+                endpoint=_create_toml_find_version_endpoint(file_type),
             )
-            for file_type in ("lock", "pep621")
+            for file_type in version_finders.FILE_TYPES
         ],
     ],
     exception_handlers={
         BaseUnsupportedError: BaseUnsupportedError.exception_handler,
         InvalidVersionFileContentError: InvalidVersionFileContentError.exception_handler,
-        gidgethub.GitHubException: (
-            lambda _request, exc: JSONResponse(
-                {"error_message": f"Github's response: {exc}"}, status_code=502
-            )
-        ),
-        **{
-            exception: (
-                lambda _request, exc: JSONResponse(
-                    {"error_message": f"Proxy: {exc}"}, status_code=502
-                )
-            )
-            for exception in (aiohttp.ConnectionTimeoutError, aiohttp.ClientConnectorDNSError)
-        },
+        gidgethub.GitHubException: _github_exception_handler,
+        aiohttp.ConnectionTimeoutError: _proxy_exception_handler,
+        aiohttp.ClientConnectorDNSError: _proxy_exception_handler,
         BaseUnknownPathParameterError: BaseUnknownPathParameterError.exception_handler,
     },
 )
@@ -0,0 +1,20 @@
+"""Custom HTTP response classes used throughout this project."""
+
+from typing import TYPE_CHECKING, override
+
+import orjson
+from starlette.responses import JSONResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+__all__: Sequence[str] = ("ORJSONResponse",)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON HTTP response that renders its content directly to bytes using orjson."""
+
+    @override
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content)
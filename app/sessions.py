@@ -0,0 +1,47 @@
+"""Shared HTTP client session used for every outbound request."""
+
+from typing import TYPE_CHECKING, override
+
+import aiohttp
+
+import config
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+
+__all__: Sequence[str] = ("SharedClientSession", "shared_client_session")
+
+
+class SharedClientSession:
+    """Lazily created `aiohttp.ClientSession`, kept open to reuse pooled connections."""
+
+    __slots__ = ("_session",)
+
+    @override
+    def __init__(self) -> None:
+        self._session: aiohttp.ClientSession | None = None
+
+    def __call__(self) -> aiohttp.ClientSession:
+        """Retrieve the shared session, creating a new one if none is currently open."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                conn_timeout=config.GITHUB_API_TIMEOUT,
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session, if one is currently open."""
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+
+
+shared_client_session: Final[SharedClientSession] = SharedClientSession()
@@ -15,16 +15,14 @@ __all__: Sequence[str] = (
 )
 
 
-def _validate_value(
-    *, pattern: str, value: str, name: str, ignore_case: bool = False
-) -> Literal[True]:
-    if not pattern.startswith(r"\A"):
-        pattern = rf"\A{pattern}"
+_GIT_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"[a-zA-Z0-9\-._]+")
+_PACKAGE_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9]", flags=re.IGNORECASE | re.ASCII
+)
 
-    if not pattern.endswith(r"\Z"):
-        pattern = rf"{pattern}\Z"
 
-    if not re.fullmatch(pattern, value, flags=re.IGNORECASE if ignore_case else 0):
+def _validate_value(*, pattern: re.Pattern[str], value: str, name: str) -> Literal[True]:
+    if not pattern.fullmatch(value):
         INVALID_VALUE_MESSAGE: Final[str] = f"Invalid '{name}'."
         raise ValueError(INVALID_VALUE_MESSAGE)
 
@@ -33,19 +31,16 @@ def _validate_value(
 
 def validate_owner(owner: str) -> Literal[True]:
     """Ensure the given string is a valid Git repository owner name."""
-    return _validate_value(pattern=r"\A[a-zA-Z0-9\-._]+\Z", value=owner, name="owner")
+    return _validate_value(pattern=_GIT_NAME_PATTERN, value=owner, name="owner")
 
 
 def validate_repo(repo: str) -> Literal[True]:
     """Ensure the given string is a valid Git repository project name."""
-    return _validate_value(pattern=r"\A[a-zA-Z0-9\-._]+\Z", value=repo, name="repo")
+    return _validate_value(pattern=_GIT_NAME_PATTERN, value=repo, name="repo")
 
 
 def validate_package_name(package_name: str) -> Literal[True]:
     """Ensure the given string is a valid package name."""
     return _validate_value(
-        pattern=r"\A[A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9]\Z",
-        value=package_name,
-        name="package_name",
-        ignore_case=True,
+        pattern=_PACKAGE_NAME_PATTERN, value=package_name, name="package_name"
     )
@@ -1,17 +1,24 @@
 """Package version finders which can parse from lock or PEP621 files."""
 
 import abc
+import asyncio
+import functools
+import logging
 import re
+import sys
+import time
 import tomllib
-from collections.abc import Iterable, Mapping
+from collections import defaultdict
 from enum import Enum
 from pathlib import PurePosixPath
 from tomllib import TOMLDecodeError
 from typing import TYPE_CHECKING, cast, final, override
 
-from packaging.requirements import Requirement
-from typed_classproperties import classproperty
+import aiohttp
+import gidgethub
+from packaging.requirements import InvalidRequirement, Requirement
 
+import config
 from exceptions import (
     InvalidVersionFileContentError,
     MissingPackageInVersionFileError,
@@ -22,23 +29,146 @@ from file_fetchers import GitHubFileFetcher
 from validators import validate_package_name
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from typing import Final, Self
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from typing import ClassVar, Final, Self
 
     from file_fetchers import BaseFileFetcher
 
 
 __all__: Sequence[str] = (
+    "FILE_TYPES",
     "BaseVersionFinder",
     "PEP751VersionFinder",
     "PoetryVersionFinder",
     "UVVersionFinder",
+    "refresh_cached_versions",
 )
 
 
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+_FILE_TYPE_PARSERS: Final[Mapping[str, Callable[[BaseVersionFinder], Awaitable[str]]]] = {
+    "lock": lambda version_finder: version_finder.parse_lock(),
+    "pep621": lambda version_finder: version_finder.parse_pep621(),
+}
+FILE_TYPES: Final[Sequence[str]] = tuple(_FILE_TYPE_PARSERS)
+
+_PACKAGE_NAME_SEPARATORS_TABLE: Final[Mapping[int, int]] = str.maketrans("_.", "--")
+_REQUIREMENT_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\s*([A-Z0-9](?:[A-Z0-9._-]*[A-Z0-9])?)", flags=re.IGNORECASE
+)
+
+
+def _normalise_package_name(package_name: str) -> str:
+    normalised_package_name: str = package_name.translate(
+        _PACKAGE_NAME_SEPARATORS_TABLE
+    ).lower()
+
+    while "--" in normalised_package_name:
+        normalised_package_name = normalised_package_name.replace("--", "-")
+
+    return sys.intern(normalised_package_name)
+
+
+def _convert_toml(raw_toml: str) -> Mapping[str, object]:
+    toml_decode_error: TOMLDecodeError
+    try:
+        return tomllib.loads(raw_toml)
+    except TOMLDecodeError as toml_decode_error:
+        raise InvalidVersionFileContentError from toml_decode_error
+
+
+@functools.lru_cache(maxsize=128)
+def _index_locked_versions(raw_lock_contents: str) -> Mapping[str, object]:
+    current_packages: object | None = _convert_toml(raw_lock_contents).get("package", None)
+
+    if not isinstance(current_packages, list):
+        raise InvalidVersionFileContentError
+
+    locked_versions: dict[str, object] = {}
+
+    current_package: object
+    for current_package in current_packages:
+        if not isinstance(current_package, dict):
+            continue
+
+        current_package_name: object | None = cast("dict[str, object]", current_package).get(
+            "name", None
+        )
+
+        if not isinstance(current_package_name, str):
+            continue
+
+        locked_versions.setdefault(
+            _normalise_package_name(current_package_name),
+            cast("dict[str, object]", current_package).get("version", None),
+        )
+
+    return locked_versions
+
+
+@functools.lru_cache(maxsize=128)
+def _index_pep621_dependencies(raw_pep621_contents: str) -> Mapping[str, str]:
+    project_contents: object | None = _convert_toml(raw_pep621_contents).get("project", None)
+
+    if not isinstance(project_contents, dict):
+        raise InvalidVersionFileContentError
+
+    dependencies: object | None = cast("dict[str, object]", project_contents).get(
+        "dependencies", None
+    )
+
+    if not isinstance(dependencies, list):
+        raise InvalidVersionFileContentError
+
+    indexed_dependencies: dict[str, str] = {}
+
+    dependency: object
+    for dependency in dependencies:
+        if not isinstance(dependency, str):
+            continue
+
+        requirement_name_match: re.Match[str] | None = _REQUIREMENT_NAME_PATTERN.match(
+            dependency
+        )
+        if requirement_name_match is None:
+            continue
+
+        indexed_dependencies.setdefault(
+            _normalise_package_name(requirement_name_match[1]), dependency
+        )
+
+    return indexed_dependencies
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_requirement_specifier(dependency: str) -> str:
+    invalid_requirement_error: InvalidRequirement
+    try:
+        return str(Requirement(dependency).specifier)
+    except InvalidRequirement as invalid_requirement_error:
+        raise InvalidVersionFileContentError from invalid_requirement_error
+
+
 class BaseVersionFinder(abc.ABC):
     """Core functionality for version finder implementation classes."""
 
+    __slots__ = (
+        "_lock_file_fetcher",
+        "_lock_file_path",
+        "_package_name",
+        "_pep621_file_fetcher",
+        "_pep621_file_path",
+    )
+
+    _LOCK_FILE_NAME: ClassVar[str]
+    """
+    The fixed file name of this version finder's lock file.
+
+    E.g. `uv.lock`, `poetry.lock` or `pylock.toml`.
+    """
+
     @override
     def __init__(
         self,
@@ -50,20 +180,16 @@ class BaseVersionFinder(abc.ABC):
         package_name: str,
     ) -> None:
         self._lock_file_fetcher: BaseFileFetcher = lock_file_fetcher
-        self._lock_subdirectory: PurePosixPath | None = lock_subdirectory
+        self._lock_file_path: PurePosixPath = (
+            PurePosixPath("/") if lock_subdirectory is None else lock_subdirectory
+        ) / self._LOCK_FILE_NAME
         self._pep621_file_fetcher: BaseFileFetcher = pep621_file_fetcher
-        self._pep621_subdirectory: PurePosixPath | None = pep621_subdirectory
+        self._pep621_file_path: PurePosixPath = (
+            PurePosixPath("/") if pep621_subdirectory is None else pep621_subdirectory
+        ) / "pyproject.toml"
 
         validate_package_name(package_name)
-        self._package_name: str = re.sub(r"[-_.]+", "-", package_name).lower()
-
-    @classmethod
-    def _convert_toml(cls, raw_toml: str) -> Mapping[str, object]:
-        toml_decode_error: TOMLDecodeError
-        try:
-            return tomllib.loads(raw_toml)
-        except TOMLDecodeError as toml_decode_error:
-            raise InvalidVersionFileContentError from toml_decode_error
+        self._package_name: str = _normalise_package_name(package_name)
 
     @classmethod
     def shortcut_factory(
@@ -97,48 +223,25 @@ class BaseVersionFinder(abc.ABC):
 
     async def parse_pep621(self) -> str:
         """Retrieve the version limits of the selected package in the selected PEP621 file."""
-        project_contents: object | None = self._convert_toml(
+        indexed_dependencies: Mapping[str, str] = _index_pep621_dependencies(
             await self._pep621_file_fetcher(content_file=self.pep621_file_path)
-        ).get("project", None)
-
-        if project_contents is None or not isinstance(project_contents, Mapping):
-            raise InvalidVersionFileContentError
-
-        dependencies: object | None = cast("Mapping[str, object]", project_contents).get(
-            "dependencies", None
         )
 
-        if dependencies is None or not isinstance(dependencies, Iterable):
-            raise InvalidVersionFileContentError
-
-        dependency: object
-        for dependency in dependencies:
-            if not isinstance(dependency, str):
-                continue
-
-            requirement: Requirement = Requirement(dependency)
-            if requirement.name != self.package_name:
-                continue
-
-            return str(requirement.specifier)
-
-        raise MissingPackageInVersionFileError(package_name=self.package_name)
-
-    @classproperty
-    @abc.abstractmethod
-    def _LOCK_FILE_NAME(cls) -> str:
-        """
-        The fixed file name of this version finder's lock file.
+        dependency: str
+        key_error: KeyError
+        try:
+            dependency = indexed_dependencies[self.package_name]
+        except KeyError as key_error:
+            raise MissingPackageInVersionFileError(
+                package_name=self.package_name
+            ) from key_error
 
-        E.g. `uv.lock`, `poetry.lock` or `pylock.toml`.
-        """
+        return _parse_requirement_specifier(dependency)
 
     @property
     def lock_file_path(self) -> PurePosixPath:
         """The location of this version finder's lock file."""
-        return (
-            PurePosixPath("/") if self._lock_subdirectory is None else self._lock_subdirectory
-        ) / self._LOCK_FILE_NAME
+        return self._lock_file_path
 
     @property
     def pep621_file_path(self) -> PurePosixPath:
@@ -148,9 +251,7 @@ class BaseVersionFinder(abc.ABC):
         This file can be used as an alternative version identifier for a given package,
         in contrast to the associated lock file finder.
         """
-        return (
-            PurePosixPath("/") if self._lock_subdirectory is None else self._lock_subdirectory
-        ) / "pyproject.toml"
+        return self._pep621_file_path
 
     @property
     def package_name(self) -> str:
@@ -161,65 +262,40 @@ class BaseVersionFinder(abc.ABC):
 class PoetryVersionFinder(BaseVersionFinder):
     """Finder callable to retrieve a package's locked version from a poetry lock file."""
 
-    @classproperty
-    @override
-    def _LOCK_FILE_NAME(cls) -> str:
-        return "poetry.lock"
+    __slots__ = ()
+
+    _LOCK_FILE_NAME: ClassVar[str] = "poetry.lock"
 
     @classmethod
     @override
     async def _parse_lock(cls, *, raw_lock_contents: str, package_name: str) -> str:
-        current_packages: object | None = cls._convert_toml(raw_lock_contents).get(
-            "package", None
-        )
+        current_package_version: object | None
+        key_error: KeyError
+        try:
+            current_package_version = _index_locked_versions(raw_lock_contents)[package_name]
+        except KeyError as key_error:
+            raise MissingPackageInVersionFileError(package_name=package_name) from key_error
 
-        if current_packages is None or not isinstance(current_packages, Iterable):
+        if not isinstance(current_package_version, str):
             raise InvalidVersionFileContentError
 
-        current_package: object
-        for current_package in current_packages:
-            if not isinstance(current_package, Mapping):
-                continue
-
-            current_package_name: object | None = cast(
-                "Mapping[str, object]", current_package
-            ).get("name", None)
-
-            if (
-                current_package_name is None
-                or not isinstance(current_package_name, str)
-                or current_package_name != package_name
-            ):
-                continue
-
-            current_package_version: object | None = cast(
-                "Mapping[str, object]", current_package
-            ).get("version", None)
-
-            if current_package_version is None or not isinstance(current_package_version, str):
-                raise InvalidVersionFileContentError
-
-            return current_package_version
-
-        raise MissingPackageInVersionFileError(package_name=package_name)
+        return current_package_version
 
 
 class UVVersionFinder(PoetryVersionFinder):
     """Finder callable to retrieve a package's locked version from a uv lock file."""
 
-    @classproperty
-    @override
-    def _LOCK_FILE_NAME(cls) -> str:
-        return "uv.lock"
+    __slots__ = ()
+
+    _LOCK_FILE_NAME: ClassVar[str] = "uv.lock"
 
 
 class PEP751VersionFinder(BaseVersionFinder):
     """Finder callable to retrieve a package's locked version from a PEP751 lock file."""
 
-    @classproperty
-    @override
-    def _LOCK_FILE_NAME(cls) -> str:
-        return "pylock.toml"
+    __slots__ = ()
+
+    _LOCK_FILE_NAME: ClassVar[str] = "pylock.toml"
 
     @classmethod
     @override
@@ -245,13 +321,145 @@ class VersionMap(Enum):
     )
 
     async def fetch_version(self, file_type: str) -> str:
-        """Retrieve the current version of the selected package inside the selected project."""
-        version_finder: BaseVersionFinder = self.value
-
-        match file_type:
-            case "lock":
-                return await version_finder.parse_lock()
-            case "pep621":
-                return await version_finder.parse_pep621()
-            case _:
-                raise UnknownFileTypeError(file_type=file_type)
+        """
+        Retrieve the current version of the selected package inside the selected project.
+
+        Versions are cached for `VERSION_CACHE_TTL` seconds,
+        and concurrent requests for the same uncached version share a single fetch.
+        If the upstream fetch fails, any previously cached version is kept and returned.
+        A `VERSION_CACHE_TTL` of 0 or less disables caching, so every call fetches directly.
+        """
+        file_type_parser: Callable[[BaseVersionFinder], Awaitable[str]] = (
+            _get_file_type_parser(file_type)
+        )
+        if config.VERSION_CACHE_TTL <= 0:
+            return await file_type_parser(self.value)
+
+        cache_key: tuple[VersionMap, str] = (self, file_type)
+
+        cached_version: str | None = _get_cached_version(cache_key)
+        if cached_version is not None:
+            return cached_version
+
+        async with _VERSION_CACHE_LOCKS[cache_key]:
+            cached_version = _get_cached_version(cache_key)
+            if cached_version is not None:
+                return cached_version
+
+            return await self._fetch_and_cache_version(file_type, file_type_parser)
+
+    async def refresh_version(self, file_type: str) -> str:
+        """Fetch the current version of the selected package, replacing any cached version."""
+        file_type_parser: Callable[[BaseVersionFinder], Awaitable[str]] = (
+            _get_file_type_parser(file_type)
+        )
+
+        async with _VERSION_CACHE_LOCKS[(self, file_type)]:
+            return await self._fetch_and_cache_version(file_type, file_type_parser)
+
+    async def _fetch_and_cache_version(
+        self, file_type: str, file_type_parser: Callable[[BaseVersionFinder], Awaitable[str]]
+    ) -> str:
+        cache_key: tuple[VersionMap, str] = (self, file_type)
+
+        version: str
+        fetch_error: Exception
+        try:
+            version = await file_type_parser(self.value)
+        except _UPSTREAM_FETCH_ERRORS as fetch_error:
+            stale_cached_version: tuple[float, str] | None = _VERSION_CACHE.get(
+                cache_key, None
+            )
+            if stale_cached_version is None:
+                raise
+
+            version = stale_cached_version[1]
+            logger.warning(
+                "Keeping stale cached %s version of %s after a failed fetch: %s",
+                file_type,
+                self.name,
+                fetch_error,
+            )
+
+        _VERSION_CACHE[cache_key] = (time.monotonic(), version)
+        return version
+
+
+def _get_file_type_parser(file_type: str) -> Callable[[BaseVersionFinder], Awaitable[str]]:
+    file_type_parser: Callable[[BaseVersionFinder], Awaitable[str]] | None = (
+        _FILE_TYPE_PARSERS.get(file_type, None)
+    )
+    if file_type_parser is None:
+        raise UnknownFileTypeError(file_type=file_type)
+
+    return file_type_parser
+
+
+_UPSTREAM_FETCH_ERRORS: Final[tuple[type[Exception], ...]] = (
+    aiohttp.ClientError,
+    gidgethub.GitHubException,
+    TimeoutError,
+)
+_VERSION_CACHE: Final[dict[tuple[VersionMap, str], tuple[float, str]]] = {}
+# A lock is created on first use of each key. This stays bounded, because keys are
+# (VersionMap member, file type) pairs and both of those sets are fixed.
+_VERSION_CACHE_LOCKS: Final[defaultdict[tuple[VersionMap, str], asyncio.Lock]] = defaultdict(
+    asyncio.Lock
+)
+
+
+def _get_cached_version(cache_key: tuple[VersionMap, str]) -> str | None:
+    cached_version: tuple[float, str] | None = _VERSION_CACHE.get(cache_key, None)
+    if cached_version is None:
+        return None
+
+    cached_at: float
+    version: str
+    cached_at, version = cached_version
+    if time.monotonic() - cached_at >= config.VERSION_CACHE_TTL:
+        return None
+
+    return version
+
+
+async def refresh_cached_versions() -> None:
+    """
+    Fetch every known version into the version cache.
+
+    A version whose file cannot be fetched keeps its stale cached value.
+    Any other failure is logged and leaves the cached value to expire as normal.
+    Failures caused by the version file's content are logged without a traceback,
+    because they will keep recurring until that file changes.
+    """
+    version_requests: Sequence[tuple[VersionMap, str]] = [
+        (version_file, file_type) for version_file in VersionMap for file_type in FILE_TYPES
+    ]
+    refresh_results: Sequence[str | BaseException] = await asyncio.gather(
+        *(
+            version_file.refresh_version(file_type)
+            for version_file, file_type in version_requests
+        ),
+        return_exceptions=True,
+    )
+
+    version_request: tuple[VersionMap, str]
+    refresh_result: str | BaseException
+    for version_request, refresh_result in zip(version_requests, refresh_results, strict=True):
+        if not isinstance(refresh_result, Exception):
+            continue
+
+        if isinstance(refresh_result, InvalidVersionFileContentError):
+            logger.info(
+                "Could not refresh cached %s version of %s: %s",
+                version_request[1],
+                version_request[0].name,
+                refresh_result,
+            )
+            continue
+
+        logger.warning(
+            "Failed to refresh cached %s version of %s.",
+            version_request[1],
+            version_request[0].name,
+            exc_info=refresh_result,
+        )
@@ -0,0 +1,5 @@
+"""Shared pytest configuration, applied before any application module is imported."""
+
+import os
+
+os.environ.setdefault("GITHUB_API_KEY", "test-github-api-key")
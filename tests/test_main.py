@@ -0,0 +1,23 @@
+"""Tests for the HTTP endpoints in `main`."""
+
+from typing import TYPE_CHECKING
+
+from starlette.testclient import TestClient
+
+import main
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+
+def test_package_name_alias_redirect_keeps_path_and_query() -> None:
+    """A package name alias redirects to the canonical name, keeping the query string."""
+    response: Response = TestClient(main.app).get(
+        "/lock/CarrotManMatt/ccft-pymarkdown/PyMarkdown?format=json", follow_redirects=False
+    )
+
+    assert response.status_code == 308
+    assert (
+        response.headers["location"]
+        == "/lock/CarrotManMatt/ccft-pymarkdown/pymarkdownlnt?format=json"
+    )
@@ -0,0 +1,79 @@
+"""Tests for the package version finders in `version_finders`."""
+
+import asyncio
+import tomllib
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from exceptions import InvalidVersionFileContentError
+from file_fetchers import BaseFileFetcher, GitHubFileFetcher
+from version_finders import UVVersionFinder
+
+if TYPE_CHECKING:
+    from typing import Final
+
+
+_UV_LOCK_PATH: Final[Path] = Path(__file__).parent.parent / "uv.lock"
+
+
+class _StaticFileFetcher(BaseFileFetcher):
+    """Fetcher callable that returns the same fixed contents for any requested file."""
+
+    __slots__ = ("_contents",)
+
+    @override
+    def __init__(self, contents: str) -> None:
+        self._contents: str = contents
+
+    @override
+    async def __call__(self, content_file: PurePosixPath) -> str:
+        del content_file
+        return self._contents
+
+
+def _find_locked_version(raw_lock_contents: str, package_name: str) -> str:
+    file_fetcher: _StaticFileFetcher = _StaticFileFetcher(raw_lock_contents)
+    return asyncio.run(
+        UVVersionFinder(
+            lock_file_fetcher=file_fetcher,
+            pep621_file_fetcher=file_fetcher,
+            package_name=package_name,
+        ).parse_lock()
+    )
+
+
+def test_version_file_paths_use_their_own_subdirectories() -> None:
+    """The lock & PEP621 file paths are each built from their own subdirectory."""
+    file_fetcher: GitHubFileFetcher = GitHubFileFetcher(owner="owner", repo="repo")
+    version_finder: UVVersionFinder = UVVersionFinder(
+        lock_file_fetcher=file_fetcher,
+        lock_subdirectory=PurePosixPath("/backend"),
+        pep621_file_fetcher=file_fetcher,
+        pep621_subdirectory=PurePosixPath("/backend/app"),
+        package_name="starlette",
+    )
+
+    assert version_finder.lock_file_path == PurePosixPath("/backend/uv.lock")
+    assert version_finder.pep621_file_path == PurePosixPath("/backend/app/pyproject.toml")
+
+
+def test_locked_versions_match_tomllib() -> None:
+    """Every package in this repository's lock file resolves to the version tomllib reads."""
+    raw_lock_contents: str = _UV_LOCK_PATH.read_text(encoding="utf-8")
+    locked_packages: list[dict[str, object]] = tomllib.loads(raw_lock_contents)["package"]
+    assert locked_packages
+
+    locked_package: dict[str, object]
+    for locked_package in locked_packages:
+        assert (
+            _find_locked_version(raw_lock_contents, str(locked_package["name"]))
+            == locked_package["version"]
+        )
+
+
+def test_lock_file_with_broken_package_header_is_rejected() -> None:
+    """A lock file that is not valid TOML is rejected, even if the package looks findable."""
+    with pytest.raises(InvalidVersionFileContentError):
+        _find_locked_version('[[package]\nname = "foo"\nversion = "1.0"\n', "foo")